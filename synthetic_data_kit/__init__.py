@@ -7,4 +7,20 @@
 Synthetic Data Kit: A toolkit for preparing synthetic data for LLM fine-tuning
 """
 
-__version__ = "0.0.1"
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+__version__ = "0.0.1"
+
+if TYPE_CHECKING:
+    from synthetic_data_kit.models.llm_client import LLMClient
+
+__all__ = ["LLMClient", "__version__"]
+
+
+def __getattr__(name):
+    # Resolve LLMClient on first access so importing the package stays cheap
+    if name == "LLMClient":
+        from synthetic_data_kit.models.llm_client import LLMClient
+        globals()["LLMClient"] = LLMClient
+        return LLMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
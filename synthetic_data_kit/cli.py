@@ -15,7 +15,6 @@ from rich.table import Table
 
 from synthetic_data_kit.utils.config import load_config, get_vllm_config, get_openai_config, get_llm_provider, get_path_config
 from synthetic_data_kit.core.context import AppContext
-from synthetic_data_kit.server.app import run_server
 
 # Initialize Typer app
 app = typer.Typer(
@@ -767,6 +766,8 @@ def server(
     including generating and curating QA pairs, as well as viewing
     and managing generated files.
     """
+    from synthetic_data_kit.server.app import run_server
+
     provider = get_llm_provider(ctx.config)
     console.print(f"Starting web server with {provider} provider...", style="green")
     console.print(f"Web interface available at: http://{host}:{port}", style="bold green")
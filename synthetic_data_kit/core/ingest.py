@@ -44,6 +44,10 @@ def determine_parser(file_path: str, config: Dict[str, Any], multimodal: bool =
     from synthetic_data_kit.parsers.multimodal_parser import MultimodalParser
 
     ext = os.path.splitext(file_path)[1].lower()
+    ingest_config = (config or {}).get("ingest", {})
+    pdf_engine = ingest_config.get("pdf_engine", "pymupdf")
+    pdf_fast_layout = ingest_config.get("pdf_fast_layout", False)
+    html_features = ingest_config.get("html_parser", "html.parser")
     if multimodal:
         if ext in [".pdf", ".docx", ".pptx"]:
             return MultimodalParser()
@@ -51,7 +55,7 @@ def determine_parser(file_path: str, config: Dict[str, Any], multimodal: bool =
             raise ValueError(f"Unsupported file extension for multimodal parsing: {ext}")
 
     if ext == ".pdf":
-        return PDFParser()
+        return PDFParser(engine=pdf_engine, fast_layout=pdf_fast_layout)
 
     # Check if it's a URL
     if file_path.startswith(("http://", "https://")):
@@ -60,16 +64,16 @@ def determine_parser(file_path: str, config: Dict[str, Any], multimodal: bool =
             return YouTubeParser()
         # PDF URL
         elif _check_pdf_url(file_path):
-            return MultimodalParser() if multimodal else PDFParser()
+            return MultimodalParser() if multimodal else PDFParser(engine=pdf_engine, fast_layout=pdf_fast_layout)
         # HTML URL
         else:
-            return HTMLParser()
+            return HTMLParser(features=html_features)
 
     # File path - determine by extension
     if os.path.exists(file_path):
         parsers = {
-            ".html": HTMLParser(),
-            ".htm": HTMLParser(),
+            ".html": HTMLParser(features=html_features),
+            ".htm": HTMLParser(features=html_features),
             ".docx": DOCXParser(),
             ".pptx": PPTParser(),
             ".txt": TXTParser(),
@@ -102,8 +106,14 @@ def process_file(
     Returns:
         Path to the output file
     """
-    from synthetic_data_kit.utils.lance_utils import create_lance_dataset
-    import pyarrow as pa
+    from synthetic_data_kit.utils.lance_utils import (
+        create_lance_dataset,
+        MULTIMODAL_ROWS_PER_FILE,
+        MULTIMODAL_ROWS_PER_GROUP,
+        MULTIMODAL_SCHEMA,
+        TEXT_SCHEMA,
+    )
+
     # Create output directory if it doesn't exist
     if not os.path.exists(output_dir):
         os.makedirs(output_dir, exist_ok=True)
@@ -111,8 +121,11 @@ def process_file(
     # Determine parser based on file type
     parser = determine_parser(file_path, config, multimodal)
 
-    # Parse the file
-    content = parser.parse(file_path)
+    # Parse the file, streaming rows into the dataset when the parser supports it
+    if hasattr(parser, "parse_iter"):
+        content = parser.parse_iter(file_path)
+    else:
+        content = parser.parse(file_path)
 
     # Generate output filename if not provided
     if not output_name:
@@ -138,14 +151,16 @@ def process_file(
     output_name += ".lance"
     output_path = os.path.join(output_dir, output_name)
 
-    schema = pa.schema([
-        pa.field("text", pa.string()),
-        pa.field("image", pa.binary())
-    ]) if multimodal else pa.schema([
-        pa.field("text", pa.string())
-    ])
-
-    create_lance_dataset(content, output_path, schema=schema)
+    if multimodal:
+        create_lance_dataset(
+            content,
+            output_path,
+            schema=MULTIMODAL_SCHEMA,
+            max_rows_per_group=MULTIMODAL_ROWS_PER_GROUP,
+            max_rows_per_file=MULTIMODAL_ROWS_PER_FILE,
+        )
+    else:
+        create_lance_dataset(content, output_path, schema=TEXT_SCHEMA)
 
 
     return output_path
@@ -4,4 +4,17 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # vLLM client. We will expand to Cerebras, ollama. See RFC for more details
-from synthetic_data_kit.models.llm_client import LLMClient
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from synthetic_data_kit.models.llm_client import LLMClient
+
+__all__ = ["LLMClient"]
+
+
+def __getattr__(name):
+    if name == "LLMClient":
+        from synthetic_data_kit.models.llm_client import LLMClient
+        globals()["LLMClient"] = LLMClient
+        return LLMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,7 @@ import time
 import os
 import logging
 import asyncio
+import importlib.util
 from pathlib import Path
 
 from synthetic_data_kit.utils.config import load_config, get_vllm_config, get_openai_config, get_llm_provider
@@ -19,15 +20,44 @@ from synthetic_data_kit.utils.config import load_config, get_vllm_config, get_op
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Try to import OpenAI, but handle case where it's not installed
-try:
-    from openai import OpenAI
-    from openai.types.chat import ChatCompletion
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# Check whether OpenAI is installed, but only import it once an API endpoint
+# client needs it; the SDK takes hundreds of milliseconds to import
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI package not installed. To use API endpoint provider, install with 'pip install openai>=1.0.0'")
 
+# Set to openai.OpenAI by _openai_class() on first use
+OpenAI = None
+
+def _openai_class():
+    """Return the OpenAI client class, importing the SDK on first use"""
+    global OpenAI
+    if OpenAI is None:
+        from openai import OpenAI as openai_class
+        OpenAI = openai_class
+    return OpenAI
+
+# Successful vLLM server checks by api_base, as (time checked, server info),
+# so clients created per file in directory processing don't each probe the
+# server. Entries expire so long-running processes (e.g. the web server)
+# notice when vLLM goes down.
+VLLM_SERVER_CHECK_TTL = 30.0
+_VLLM_SERVER_INFO: Dict[str, Tuple[float, Any]] = {}
+
+def clear_vllm_server_cache():
+    """Forget cached vLLM server checks (e.g. after restarting the server)"""
+    _VLLM_SERVER_INFO.clear()
+
+# One keep-alive session per vLLM api_base, shared by all clients
+_VLLM_SESSIONS: Dict[str, requests.Session] = {}
+
+def _vllm_session(api_base: str) -> requests.Session:
+    """Return the pooled HTTP session for a vLLM server"""
+    session = _VLLM_SESSIONS.get(api_base)
+    if session is None:
+        session = _VLLM_SESSIONS[api_base] = requests.Session()
+    return session
+
 class LLMClient:
     def __init__(self, 
                  config_path: Optional[Path] = None,
@@ -116,14 +146,19 @@ class LLMClient:
             print(f"Using API base URL: {self.api_base}")
             client_kwargs['base_url'] = self.api_base
         
-        self.openai_client = OpenAI(**client_kwargs)
+        self.openai_client = _openai_class()(**client_kwargs)
     
     def _check_vllm_server(self) -> tuple:
         """Check if the VLLM server is running and accessible"""
+        cached = _VLLM_SERVER_INFO.get(self.api_base)
+        if cached and time.monotonic() - cached[0] < VLLM_SERVER_CHECK_TTL:
+            return True, cached[1]
         try:
             response = requests.get(f"{self.api_base}/models", timeout=5)
             if response.status_code == 200:
-                return True, response.json()
+                info = response.json()
+                _VLLM_SERVER_INFO[self.api_base] = (time.monotonic(), info)
+                return True, info
             return False, f"Server returned status code: {response.status_code}"
         except requests.exceptions.RequestException as e:
             return False, f"Server connection error: {str(e)}"
@@ -300,7 +335,7 @@ class LLMClient:
                 if verbose:
                     logger.info(f"Sending request to vLLM model {self.model}...")
                 
-                response = requests.post(
+                response = _vllm_session(self.api_base).post(
                     f"{self.api_base}/chat/completions",
                     headers={"Content-Type": "application/json"},
                     data=json.dumps(data),
@@ -568,7 +603,7 @@ class LLMClient:
                     if verbose:
                         logger.info(f"Sending batch request to vLLM model {self.model}...")
                     
-                    response = requests.post(
+                    response = _vllm_session(self.api_base).post(
                         f"{self.api_base}/chat/completions",
                         headers={"Content-Type": "application/json"},
                         data=json.dumps(request_data),
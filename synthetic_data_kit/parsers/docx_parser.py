@@ -7,6 +7,8 @@
 import os
 from typing import Dict, Any
 
+from synthetic_data_kit.utils.file_utils import ensure_dir
+
 class DOCXParser:
     """Parser for Microsoft Word documents"""
     
@@ -45,6 +47,6 @@ class DOCXParser:
             content: Extracted text content
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        ensure_dir(os.path.dirname(output_path))
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
\ No newline at end of file
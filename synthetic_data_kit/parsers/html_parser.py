@@ -7,12 +7,64 @@
 
 import os
 import requests
+from functools import lru_cache
 from typing import Dict, Any
 from urllib.parse import urlparse
 
+from synthetic_data_kit.utils.file_utils import ensure_dir
+
+# Shared across parse calls so fetching many pages from the same host reuses
+# pooled keep-alive connections instead of reconnecting for every URL
+_session = requests.Session()
+
+
+def _html_to_text(html_content: str, features: str = 'html.parser') -> str:
+    """Extract readable text from an HTML document"""
+    from bs4 import BeautifulSoup
+
+    # Parse HTML and extract text
+    soup = BeautifulSoup(html_content, features)
+    
+    # Remove script and style elements
+    for script in soup(['script', 'style']):
+        script.extract()
+    
+    # Get text
+    text = soup.get_text()
+    
+    # Break into lines and remove leading and trailing space
+    lines = (line.strip() for line in text.splitlines())
+    # Break multi-headlines into a line each
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    # Drop blank lines
+    return '\n'.join(chunk for chunk in chunks if chunk)
+
+
+@lru_cache(maxsize=32)
+def _parse_local_file(file_path: str, mtime_ns: int, size: int, features: str) -> str:
+    """Read and extract text from a local HTML file
+
+    Cached on the file's modification time and size, so re-parsing an
+    unchanged file skips both the read and the BeautifulSoup pass while an
+    edited file is picked up automatically.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return _html_to_text(f.read(), features)
+
+
 class HTMLParser:
     """Parser for HTML files and web pages"""
     
+    def __init__(self, features: str = 'html.parser'):
+        """Initialize the HTML parser
+        
+        Args:
+            features: BeautifulSoup tree builder, e.g. "html.parser" (default,
+                pure Python) or "lxml" (C-based and several times faster,
+                requires lxml)
+        """
+        self.features = features
+    
     def parse(self, file_path: str) -> str:
         """Parse an HTML file or URL into plain text
         
@@ -30,32 +82,13 @@ class HTMLParser:
         # Determine if file_path is a URL or a local file
         if file_path.startswith(('http://', 'https://')):
             # It's a URL, fetch content
-            response = requests.get(file_path)
+            response = _session.get(file_path)
             response.raise_for_status()
-            html_content = response.text
-        else:
-            # It's a local file, read it
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-        
-        # Parse HTML and extract text
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(['script', 'style']):
-            script.extract()
-        
-        # Get text
-        text = soup.get_text()
-        
-        # Break into lines and remove leading and trailing space
-        lines = (line.strip() for line in text.splitlines())
-        # Break multi-headlines into a line each
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        # Drop blank lines
-        text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        return text
+            return _html_to_text(response.text, self.features)
+
+        # It's a local file, reuse the previous result if it hasn't changed
+        stat = os.stat(file_path)
+        return _parse_local_file(file_path, stat.st_mtime_ns, stat.st_size, self.features)
     
     def save(self, content: str, output_path: str) -> None:
         """Save the extracted text to a file
@@ -64,6 +97,6 @@ class HTMLParser:
             content: Extracted text content
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        ensure_dir(os.path.dirname(output_path))
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
\ No newline at end of file
@@ -5,15 +5,61 @@
 # the root directory of this source tree.
 
 import io
-from typing import List, Dict, Any
+import multiprocessing
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Any, Iterator
 
-import fitz  # PyMuPDF
+import pymupdf
 from PIL import Image
 
 
 import os
 import docx
-from pptx import Presentation
+
+from synthetic_data_kit.parsers.pdf_parser import MIN_PAGES_PER_WORKER, PROCESS_START_METHOD
+from synthetic_data_kit.parsers.ppt_parser import load_presentation
+
+
+def _iter_doc_pages(doc, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+    """Yield text and image rows for pages ``start`` to ``stop`` of an open PDF."""
+    # Images shared between pages (logos, backgrounds) are stored once in the
+    # PDF, so extract each xref only once. Only xrefs that are used again are
+    # kept, and only until their last use, so unique page images (e.g. scans)
+    # are not held for the rest of the document.
+    remaining_uses = Counter(
+        img[0] for page_num in range(start, stop) for img in doc.get_page_images(page_num)
+    )
+    images = {}
+    for page_num in range(start, stop):
+        page = doc.load_page(page_num)
+        text = page.get_text()
+        image_list = page.get_images(full=True)
+
+        if not image_list:
+            yield {"text": text, "image": None}
+
+        for img in image_list:
+            xref = img[0]
+            image = images.pop(xref, None)
+            if image is None:
+                image = doc.extract_image(xref)["image"]
+            remaining_uses[xref] -= 1
+            if remaining_uses[xref] > 0:
+                images[xref] = image
+            yield {"text": text, "image": image}
+
+
+def _parse_pdf_pages(file_path: str, start: int, stop: int) -> List[Dict[str, Any]]:
+    """Extract text and images from pages ``start`` to ``stop`` of a PDF.
+
+    Defined at module level so it can be sent to worker processes. Each call
+    opens its own document because PyMuPDF objects cannot be shared.
+    """
+    with pymupdf.open(file_path) as doc:
+        return list(_iter_doc_pages(doc, start, stop))
+
 
 class MultimodalParser:
     def parse(self, file_path: str) -> List[Dict[str, Any]]:
@@ -27,6 +73,23 @@ class MultimodalParser:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
                                  represents a page with its text and a single image.
         """
+        return list(self.parse_iter(file_path))
+
+    def parse_iter(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parses a file, yielding one text/image row at a time.
+
+        Lets callers stream rows straight into the output dataset instead of
+        holding every page image of the document in memory at once. Large
+        PDFs parsed in parallel hold at most one range of
+        ``MIN_PAGES_PER_WORKER`` pages per worker at a time.
+
+        Args:
+            file_path (str): The path to the file.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Rows in the same order as ``parse``.
+        """
         ext = os.path.splitext(file_path)[1].lower()
         if ext == ".pdf":
             return self._parse_pdf(file_path)
@@ -37,63 +100,77 @@ class MultimodalParser:
         else:
             raise ValueError(f"Unsupported file extension for multimodal parsing: {ext}")
 
-    def _parse_pdf(self, file_path: str) -> List[Dict[str, Any]]:
-        doc = fitz.open(file_path)
-        data = []
-
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text = page.get_text()
-            image_list = page.get_images(full=True)
-
-            if not image_list:
-                data.append({"text": text, "image": None})
-
-            for img_index, img in enumerate(image_list):
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                data.append({"text": text, "image": image_bytes})
-
-        return data
-
-    def _parse_docx(self, file_path: str) -> List[Dict[str, Any]]:
+    def _parse_pdf(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        with pymupdf.open(file_path) as doc:
+            page_count = doc.page_count
+            num_workers = min(os.cpu_count() or 1, page_count // MIN_PAGES_PER_WORKER)
+            if num_workers < 2:
+                # Small documents are read from the handle that is already open
+                yield from _iter_doc_pages(doc, 0, page_count)
+                return
+
+        yield from self._parse_pdf_parallel(file_path, page_count, num_workers)
+
+    def _parse_pdf_parallel(
+        self, file_path: str, page_count: int, num_workers: int
+    ) -> Iterator[Dict[str, Any]]:
+        # Hand out small contiguous page ranges and keep at most one range per
+        # worker in flight, so only a bounded number of pages' images are held
+        # at once. Results are yielded in page order.
+        starts = range(0, page_count, MIN_PAGES_PER_WORKER)
+        ranges = ((start, min(start + MIN_PAGES_PER_WORKER, page_count)) for start in starts)
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context(PROCESS_START_METHOD),
+        ) as executor:
+            pending = deque(
+                executor.submit(_parse_pdf_pages, file_path, start, stop)
+                for start, stop in islice(ranges, num_workers)
+            )
+            while pending:
+                page_data = pending.popleft().result()
+                for start, stop in islice(ranges, 1):
+                    pending.append(executor.submit(_parse_pdf_pages, file_path, start, stop))
+                yield from page_data
+
+    def _parse_docx(self, file_path: str) -> Iterator[Dict[str, Any]]:
         doc = docx.Document(file_path)
-        data = []
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
+        has_images = False
+        text = "".join(para.text + "\n" for para in doc.paragraphs)
 
         for rel in doc.part.rels.values():
             if "image" in rel.target_ref:
                 image_bytes = rel.target_part.blob
-                data.append({"text": text, "image": image_bytes})
-
-        if not data:
-            data.append({"text": text, "image": None})
+                has_images = True
+                yield {"text": text, "image": image_bytes}
 
-        return data
+        if not has_images:
+            yield {"text": text, "image": None}
 
-    def _parse_pptx(self, file_path: str) -> List[Dict[str, Any]]:
-        prs = Presentation(file_path)
-        data = []
+    def _parse_pptx(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        prs = load_presentation(file_path)
+        has_images = False
         for slide in prs.slides:
-            text = ""
+            # Collect text and pictures in a single pass over the shapes
+            text_parts = []
+            images = []
             for shape in slide.shapes:
                 if hasattr(shape, "text"):
-                    text += shape.text + "\n"
-
-            for shape in slide.shapes:
+                    text_parts.append(shape.text + "\n")
                 if shape.shape_type == 13:  # Picture
-                    image_bytes = shape.image.blob
-                    data.append({"text": text, "image": image_bytes})
-
-        if not data:
-            text = ""
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text += shape.text + "\n"
-            data.append({"text": text, "image": None})
-
-        return data
+                    images.append(shape.image.blob)
+
+            text = "".join(text_parts)
+            for image_bytes in images:
+                has_images = True
+                yield {"text": text, "image": image_bytes}
+
+        if not has_images:
+            text = "".join(
+                shape.text + "\n"
+                for slide in prs.slides
+                for shape in slide.shapes
+                if hasattr(shape, "text")
+            )
+            yield {"text": text, "image": None}
@@ -5,9 +5,45 @@
 # the root directory of this source tree.
 # PPTX parser logic
 
+import io
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
+from synthetic_data_kit.utils.file_utils import ensure_dir
+
+
+@lru_cache(maxsize=4)
+def _load_presentation_cached(file_path: str, mtime_ns: int, size: int):
+    """Open a presentation; cached on the file's modification time and size"""
+    from pptx import Presentation
+
+    return Presentation(file_path)
+
+
+def load_presentation(file_path: str):
+    """Open a PPTX file, reusing the parsed presentation if it hasn't changed
+    
+    Parsing the same deck more than once (e.g. text-only and multimodal
+    ingest) then unzips and parses its XML only once. Presentations are only
+    read by the parsers, so sharing one object is safe.
+    
+    Args:
+        file_path: Path to the PPTX file
+        
+    Returns:
+        The python-pptx Presentation
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let python-pptx report missing or unreadable files
+        from pptx import Presentation
+
+        return Presentation(file_path)
+    return _load_presentation_cached(file_path, stat.st_mtime_ns, stat.st_size)
+
+
 class PPTParser:
     """Parser for PowerPoint presentations"""
     
@@ -25,10 +61,10 @@ class PPTParser:
         except ImportError:
             raise ImportError("python-pptx is required for PPTX parsing. Install it with: pip install python-pptx")
         
-        prs = Presentation(file_path)
+        prs = load_presentation(file_path)
         
-        # Extract text from slides
-        all_text = []
+        # Extract text from slides, writing each one straight into the output
+        all_text = io.StringIO()
         
         for i, slide in enumerate(prs.slides):
             slide_text = []
@@ -43,9 +79,11 @@ class PPTParser:
                 if hasattr(shape, "text") and shape.text:
                     slide_text.append(shape.text)
             
-            all_text.append("\n".join(slide_text))
+            if i:
+                all_text.write("\n\n")
+            all_text.write("\n".join(slide_text))
         
-        text = "\n\n".join(all_text)
+        text = all_text.getvalue()
         return [{"text": text}]
     
     def save(self, content: str, output_path: str) -> None:
@@ -55,6 +93,6 @@ class PPTParser:
             content: Extracted text content
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        ensure_dir(os.path.dirname(output_path))
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
\ No newline at end of file
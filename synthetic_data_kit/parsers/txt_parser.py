@@ -4,9 +4,12 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # TXT parsering logic, probably the most minimal
+import mmap
 import os
 from typing import Dict, Any
 
+from synthetic_data_kit.utils.file_utils import ensure_dir
+
 class TXTParser:
     """Parser for plain text files"""
     
@@ -19,8 +22,19 @@ class TXTParser:
         Returns:
             Text content
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return [{"text": f.read()}]
+        # Decode straight from a memory map of the file; this skips the
+        # chunked reads and the copy into a bytes object that f.read() does
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                return [{"text": ""}]
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
+        
+        # Match text-mode reads, which translate all newlines to "\n"
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return [{"text": text}]
     
     def save(self, content: str, output_path: str) -> None:
         """Save the text to a file
@@ -29,6 +43,6 @@ class TXTParser:
             content: Text content
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        ensure_dir(os.path.dirname(output_path))
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
\ No newline at end of file
@@ -6,8 +6,11 @@
 # Download and save the transcript
 
 import os
+from operator import itemgetter
 from typing import Dict, Any
 
+from synthetic_data_kit.utils.file_utils import ensure_dir
+
 class YouTubeParser:
     """Parser for YouTube transcripts"""
     
@@ -36,10 +39,8 @@ class YouTubeParser:
         # Get transcript
         transcript = YouTubeTranscriptApi.get_transcript(video_id)
         
-        # Combine transcript segments
-        combined_text = []
-        for segment in transcript:
-            combined_text.append(segment['text'])
+        # Combine transcript segments in a single C-level pass
+        combined_text = "\n".join(map(itemgetter('text'), transcript))
         
         # Add video metadata
         metadata = (
@@ -50,7 +51,7 @@ class YouTubeParser:
             f"Transcript:\n"
         )
         
-        return metadata + "\n".join(combined_text)
+        return metadata + combined_text
     
     def save(self, content: str, output_path: str) -> None:
         """Save the transcript to a file
@@ -59,6 +60,6 @@ class YouTubeParser:
             content: Transcript content
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        ensure_dir(os.path.dirname(output_path))
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
\ No newline at end of file
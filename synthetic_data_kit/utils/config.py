@@ -4,11 +4,18 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # Config Utilities
+import copy
 import yaml
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Default config location relative to the package (original)
 ORIGINAL_CONFIG_PATH = os.path.abspath(
     os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
@@ -23,6 +30,9 @@ PACKAGE_CONFIG_PATH = os.path.abspath(
 # Use internal package path as default
 DEFAULT_CONFIG_PATH = PACKAGE_CONFIG_PATH
 
+# Parsed configs keyed by (path, mtime_ns, size) so an edited file is re-read
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Load YAML configuration file"""
     if config_path is None:
@@ -39,8 +49,13 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found at {config_path}")
     
     print(f"Loading config from: {config_path}")
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    stat = os.stat(config_path)
+    cache_key = (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+    if cache_key not in _CONFIG_CACHE:
+        with open(config_path, 'r') as f:
+            _CONFIG_CACHE[cache_key] = yaml.load(f, Loader=_YamlLoader)
+    # Callers modify their config (e.g. chunk size overrides), so hand out copies
+    config = copy.deepcopy(_CONFIG_CACHE[cache_key])
     
     # Debug: Print LLM provider if it exists
     if 'llm' in config and 'provider' in config['llm']:
@@ -0,0 +1,19 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+# File system helpers shared by the parsers
+
+import os
+
+def ensure_dir(path: str) -> None:
+    """Create a directory (and parents) if needed
+    
+    An empty path (a bare filename in the current directory) is a no-op.
+    
+    Args:
+        path: Directory path to create
+    """
+    if path:
+        os.makedirs(path, exist_ok=True)
@@ -6,31 +6,157 @@
 
 import lance
 import pyarrow as pa
-from typing import List, Dict, Any, Optional
+from array import array
+from itertools import chain, islice
+from typing import List, Dict, Any, Optional, Iterable, Iterator
 import os
 
+# Number of rows per record batch when streaming data into Lance
+LANCE_BATCH_SIZE = 64
+
+# Pin the Lance file format so datasets get the 2.1 encodings (and the column
+# compression settings below) regardless of the installed pylance default
+LANCE_STORAGE_VERSION = "2.1"
+
+# Lance column encodings: text compresses well with zstd, while images are
+# already compressed (PNG/JPEG) and only cost CPU to recompress
+_TEXT_METADATA = {b"lance-encoding:compression": b"zstd"}
+_IMAGE_METADATA = {b"lance-encoding:compression": b"none"}
+
+# Schemas for datasets written by ingest. The large_* types use 64-bit
+# offsets, so one huge document or a batch of large page images can't
+# overflow a column.
+TEXT_SCHEMA = pa.schema([
+    pa.field("text", pa.large_string(), metadata=_TEXT_METADATA)
+])
+MULTIMODAL_SCHEMA = pa.schema([
+    pa.field("text", pa.large_string(), metadata=_TEXT_METADATA),
+    pa.field("image", pa.large_binary(), metadata=_IMAGE_METADATA)
+])
+
+# Row layout for image-heavy datasets: small row groups let readers fetch
+# large image blobs in parallel, and capping rows per file keeps files a
+# manageable size
+MULTIMODAL_ROWS_PER_GROUP = 64
+MULTIMODAL_ROWS_PER_FILE = 8192
+
+# Largest data buffer a 32-bit offset string array can address
+_MAX_STRING_BYTES = 2**31 - 1
+
+
+def _string_array(values: List[Any], type: pa.DataType) -> pa.Array:
+    """Build a string array straight from UTF-8 buffers.
+
+    PyArrow's generic converter walks each Python string element by element,
+    which is slow for the multi-megabyte documents parsers produce. Encoding
+    once and wrapping the bytes as the array's data buffer is much faster.
+    Falls back to ``pa.array`` for nulls, non-strings or data too large for
+    the type.
+    """
+    if not all(isinstance(value, str) for value in values):
+        return pa.array(values, type=type)
+
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = [0]
+    for chunk in encoded:
+        offsets.append(offsets[-1] + len(chunk))
+
+    if pa.types.is_large_string(type):
+        offset_code = "q"
+    elif offsets[-1] <= _MAX_STRING_BYTES:
+        offset_code = "i"
+    else:
+        return pa.array(values, type=type)
+
+    data = encoded[0] if len(encoded) == 1 else b"".join(encoded)
+    return pa.Array.from_buffers(
+        type,
+        len(values),
+        [None, pa.py_buffer(array(offset_code, offsets)), pa.py_buffer(data)],
+    )
+
+
+def _column_array(values: List[Any], type: pa.DataType) -> pa.Array:
+    """Convert one column of row values to an Arrow array of ``type``."""
+    if pa.types.is_string(type) or pa.types.is_large_string(type):
+        return _string_array(values, type)
+    return pa.array(values, type=type)
+
+
+def _iter_record_batches(
+    data: Iterable[Dict[str, Any]],
+    schema: pa.Schema,
+    batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    """Yield record batches over consecutive runs of rows from ``data``."""
+    rows_iter = iter(data)
+    while True:
+        rows = list(islice(rows_iter, batch_size))
+        if not rows:
+            return
+        yield pa.RecordBatch.from_arrays(
+            [_column_array([row.get(field.name) for row in rows], field.type) for field in schema],
+            schema=schema,
+        )
+
+
 def create_lance_dataset(
-    data: List[Dict[str, Any]],
+    data: Iterable[Dict[str, Any]],
     output_path: str,
-    schema: Optional[pa.Schema] = None
+    schema: Optional[pa.Schema] = None,
+    batch_size: int = LANCE_BATCH_SIZE,
+    max_rows_per_group: Optional[int] = None,
+    max_rows_per_file: Optional[int] = None
 ) -> None:
-    """Create a Lance dataset from a list of dictionaries.
+    """Create a Lance dataset from a list or iterator of dictionaries.
+
+    Rows are written as a stream of record batches, so only one batch of
+    Arrow data is held in memory at a time. Passing a generator (e.g. from
+    ``MultimodalParser.parse_iter``) avoids materializing the rows at all.
 
     Args:
-        data (List[Dict[str, Any]]): A list of dictionaries, where each dictionary represents a row.
+        data (Iterable[Dict[str, Any]]): Dictionaries, where each dictionary represents a row.
         output_path (str): The path to save the Lance dataset.
         schema (Optional[pa.Schema], optional): The PyArrow schema. If not provided, it will be inferred. Defaults to None.
+        batch_size (int, optional): Number of rows per record batch. Defaults to LANCE_BATCH_SIZE.
+        max_rows_per_group (Optional[int], optional): Rows per Lance row group. Defaults to Lance's default.
+        max_rows_per_file (Optional[int], optional): Rows per Lance data file. Defaults to Lance's default.
     """
-    if not data:
-        return
+    if isinstance(data, list):
+        if not data:
+            return
+        rows = data
+        sample = data
+    else:
+        # Peek at the first batch to detect empty input and infer the schema
+        data = iter(data)
+        sample = list(islice(data, batch_size))
+        if not sample:
+            return
+        rows = chain(sample, data)
 
     # Ensure the output directory exists
     output_dir = os.path.dirname(output_path)
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    table = pa.Table.from_pylist(data, schema=schema)
-    lance.write_dataset(table, output_path, mode="overwrite")
+    if schema is None:
+        schema = pa.schema(list(pa.infer_type(sample)))
+
+    write_options = {}
+    if max_rows_per_group is not None:
+        write_options["max_rows_per_group"] = max_rows_per_group
+    if max_rows_per_file is not None:
+        write_options["max_rows_per_file"] = max_rows_per_file
+
+    reader = pa.RecordBatchReader.from_batches(schema, _iter_record_batches(rows, schema, batch_size))
+    lance.write_dataset(
+        reader,
+        output_path,
+        mode="overwrite",
+        data_storage_version=LANCE_STORAGE_VERSION,
+        **write_options
+    )
 
 def load_lance_dataset(
     dataset_path: str
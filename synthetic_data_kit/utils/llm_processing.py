@@ -7,7 +7,59 @@
 import re
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from synthetic_data_kit.utils.text import _skip_bracketed
+
+# Use orjson for decoding when it is installed; its JSONDecodeError subclasses
+# json.JSONDecodeError, so the handlers below cover both
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Patterns used on every parse, compiled once at import
+_NEWLINE_RE = re.compile(r'(\n\s*|\r\s*)')
+_TRAILING_COMMA_RE = re.compile(r',(\s*\}|\s*\])')
+_QA_PAIR_RE = re.compile(r'"question":\s*"((?:[^"\\]|\\.)*)"\s*,\s*"answer":\s*"((?:[^"\\]|\\.)*)"\s*')
+_NEWLINE_COLLAPSE_RE = re.compile(r'\s*\n\s*')
+_JSON_DECODER = json.JSONDecoder()
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+_RATING_OBJECT_RE = re.compile(r'(\{\s*"question"\s*:\s*"[^"]*"\s*,\s*"answer"\s*:\s*"[^"]*"\s*,\s*"rating"\s*:\s*\d+(?:\.\d+)?\s*\})')
+# A rated array spans from the first array head to the last array tail. The two
+# ends are searched separately because a single '\[...:.*"rating"...\]' pattern
+# rescans to the end of the text from every head, which is quadratic
+_RATING_ARRAY_HEAD_RE = re.compile(r'\[\s*\{\s*"question"\s*:')
+_RATING_ARRAY_TAIL_RE = re.compile(r'"rating"\s*:\s*\d+(?:\.\d+)?\s*\}\s*\]')
+
+def _loads_collapsing_newlines(json_text: str) -> Any:
+    """Parse JSON, collapsing newlines only if the text does not parse as is"""
+    try:
+        return _loads(json_text)
+    except json.JSONDecodeError:
+        return _loads(_NEWLINE_COLLAPSE_RE.sub(' ', json_text))
+
+def _loads_or_decode_first(json_text: str, text: str, start_idx: int,
+                           decode_first: bool = True) -> Any:
+    """Parse json_text, or else decode the first JSON value at text[start_idx:]
+    
+    The raw_decode fallback stops at the end of the first value, so unrelated
+    brackets later in the response do not spoil an otherwise valid answer.
+    """
+    try:
+        return _loads_collapsing_newlines(json_text)
+    except json.JSONDecodeError:
+        if not decode_first:
+            raise
+        return _JSON_DECODER.raw_decode(text, start_idx)[0]
+
+def _unescape_json_string(body: str) -> str:
+    """Decode the body of a JSON string literal, handling every escape form"""
+    try:
+        return _loads('"' + body + '"')
+    except json.JSONDecodeError:
+        # Raw control characters or invalid escapes: only unescape quotes
+        return body.replace('\\"', '"')
 
 def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
     """Parse QA pairs from LLM output with enhanced error handling"""
@@ -24,19 +76,26 @@ def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
             end = text.rfind(']') + 1
             json_text = text[start:end]
             
-            # Try to clean up the JSON to fix common issues
-            cleaned_text = re.sub(r'(\n\s*|\r\s*)', ' ', json_text)  # Remove newlines and extra spaces
-            cleaned_text = re.sub(r',(\s*\}|\s*\])', r'\1', cleaned_text)  # Remove trailing commas
-            
+            pairs = None
             try:
-                pairs = json.loads(cleaned_text)
+                # Well-formed output needs no cleanup, so try it unchanged first
+                pairs = _loads(json_text)
+            except json.JSONDecodeError:
+                # Try to clean up the JSON to fix common issues
+                cleaned_text = _NEWLINE_RE.sub(' ', json_text)  # Remove newlines and extra spaces
+                cleaned_text = _TRAILING_COMMA_RE.sub(r'\1', cleaned_text)  # Remove trailing commas
+                
+                try:
+                    pairs = _loads(cleaned_text)
+                except json.JSONDecodeError as e:
+                    if verbose:
+                        print(f"Direct JSON parsing failed: {e}")
+                        print(f"Attempted to parse: {cleaned_text[:200]}...")
+            
+            if pairs is not None:
                 if verbose:
                     print(f"Successfully parsed {len(pairs)} QA pairs")
                 return pairs
-            except json.JSONDecodeError as e:
-                if verbose:
-                    print(f"Direct JSON parsing failed: {e}")
-                    print(f"Attempted to parse: {cleaned_text[:200]}...")
     except Exception as e:
         if verbose:
             print(f"Error during JSON extraction: {e}")
@@ -44,13 +103,14 @@ def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
     # Fallback to regex pattern matching
     if verbose:
         print("Falling back to regex pattern matching")
-    qa_pattern = r'"question":\s*"((?:[^"\\]|\\.)*)"\s*,\s*"answer":\s*"((?:[^"\\]|\\.)*)"\s*'
     pairs = []
     
-    for match in re.finditer(qa_pattern, text):
+    # Every match contains a literal "question" key, so skip the scan without one
+    matches = _QA_PAIR_RE.finditer(text) if '"question"' in text else ()
+    for match in matches:
         try:
-            q = match.group(1).replace('\\"', '"')
-            a = match.group(2).replace('\\"', '"')
+            q = _unescape_json_string(match.group(1))
+            a = _unescape_json_string(match.group(2))
             pairs.append({"question": q, "answer": a})
         except Exception as e:
             if verbose:
@@ -64,6 +124,44 @@ def parse_qa_pairs(text: str) -> List[Dict[str, str]]:
     
     return pairs
 
+def _rated_items(parsed: Any) -> Optional[List[Dict[str, Any]]]:
+    """Return parsed JSON as a list of rated items, or None if it has no ratings"""
+    if isinstance(parsed, dict) and "rating" in parsed:
+        return [parsed]
+    if isinstance(parsed, list) and parsed and all(
+            isinstance(item, dict) and "rating" in item for item in parsed):
+        return parsed
+    return None
+
+def _decode_rated_array(text: str, start_idx: int) -> Optional[List[Dict[str, Any]]]:
+    """Decode the first top-level array from start_idx on that holds ratings
+    
+    Arrays without ratings (e.g. a citation like [1]) and malformed ones are
+    skipped whole, so their nested brackets are never tried.
+    """
+    while start_idx != -1:
+        try:
+            rated = _rated_items(_JSON_DECODER.raw_decode(text, start_idx)[0])
+        except json.JSONDecodeError:
+            rated = None
+        if rated is not None:
+            return rated
+        start_idx = text.find('[', _skip_bracketed(text, start_idx))
+    return None
+
+def _iter_rating_candidates(text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (source, json_text) candidates from code blocks, then regex matches"""
+    for match in _CODE_BLOCK_RE.finditer(text):
+        yield "code block", match.group(1).strip()
+    for match in _RATING_OBJECT_RE.finditer(text):
+        yield "regex", match.group(1)
+    head = _RATING_ARRAY_HEAD_RE.search(text)
+    tail = None
+    for tail in _RATING_ARRAY_TAIL_RE.finditer(text, head.end() if head else len(text)):
+        pass
+    if head and tail:
+        yield "regex", text[head.start():tail.end()]
+
 def parse_ratings(text: str, original_items: List[Dict[str, str]] = None) -> List[Dict[str, Any]]:
     """Parse rated items from LLM output
     
@@ -104,13 +202,12 @@ def parse_ratings(text: str, original_items: List[Dict[str, str]] = None) -> Lis
             end_idx = json_content.rfind('}') + 1
             json_text = json_content[start_idx:end_idx]
             
-            # Clean up the JSON string to handle common issues
-            # First, convert newlines to spaces in JSON
-            json_text = re.sub(r'\s*\n\s*', ' ', json_text)
-            
-            # Now, try to parse it
+            # Parse it, converting newlines to spaces if needed. Unless the
+            # object sits inside an array, fall back to decoding just the
+            # first value, which copes with trailing prose containing braces
             try:
-                parsed = json.loads(json_text)
+                parsed = _loads_or_decode_first(json_text, json_content, start_idx,
+                                                '[' not in json_content[:start_idx])
                 if isinstance(parsed, dict) and "rating" in parsed:
                     if verbose:
                         print("Successfully parsed single JSON object")
@@ -125,11 +222,16 @@ def parse_ratings(text: str, original_items: List[Dict[str, str]] = None) -> Lis
             end_idx = json_content.rfind(']') + 1
             json_text = json_content[start_idx:end_idx]
             
-            # Clean up the JSON string
-            json_text = re.sub(r'\s*\n\s*', ' ', json_text)
-            
             try:
-                parsed = json.loads(json_text)
+                try:
+                    parsed = _loads_collapsing_newlines(json_text)
+                except json.JSONDecodeError:
+                    # The first value may be an unrelated bracket (e.g. a
+                    # citation), so use the first array that holds ratings
+                    rated = _decode_rated_array(json_content, start_idx)
+                    if rated is None:
+                        raise
+                    parsed = rated
                 if isinstance(parsed, list):
                     for item in parsed:
                         if not isinstance(item, dict) or "rating" not in item:
@@ -148,66 +250,22 @@ def parse_ratings(text: str, original_items: List[Dict[str, str]] = None) -> Lis
             print(f"Error in primary parsing approach: {str(e)}")
     
     # Fallback to more specific methods
-    # Method 1: Code block extraction
+    # Methods 1 and 2: code blocks, then regex matches, tried lazily in that order
     try:
-        code_blocks = re.findall(r'```(?:json)?\s*([\s\S]*?)```', text)
-        if code_blocks:
-            for block in code_blocks:
-                try:
-                    # Clean up newlines in the code block
-                    clean_block = re.sub(r'\s*\n\s*', ' ', block.strip())
-                    parsed = json.loads(clean_block)
-                    if isinstance(parsed, dict) and "rating" in parsed:
-                        if verbose:
-                            print("Successfully parsed from code block (single object)")
-                        return [parsed]
-                    elif isinstance(parsed, list):
-                        valid_items = True
-                        for item in parsed:
-                            if not isinstance(item, dict) or "rating" not in item:
-                                valid_items = False
-                                break
-                        if valid_items and len(parsed) > 0:
-                            if verbose:
-                                print(f"Successfully parsed {len(parsed)} items from code block")
-                            return parsed
-                except json.JSONDecodeError:
-                    pass
-    except Exception as e:
-        if verbose:
-            print(f"Error in code block extraction: {str(e)}")
-    
-    # Method 2: Regex
-    try:
-        # Look for JSON patterns in the text
-        json_patterns = [
-            # Single object pattern
-            r'(\{\s*"question"\s*:\s*"[^"]*"\s*,\s*"answer"\s*:\s*"[^"]*"\s*,\s*"rating"\s*:\s*\d+(?:\.\d+)?\s*\})',
-            # Array pattern
-            r'(\[\s*\{\s*"question"\s*:.*"rating"\s*:\s*\d+(?:\.\d+)?\s*\}\s*\])'
-        ]
-        
-        for pattern in json_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            if matches:
-                for match in matches:
-                    try:
-                        # Clean up newlines in the match
-                        clean_match = re.sub(r'\s*\n\s*', ' ', match)
-                        parsed = json.loads(clean_match)
-                        if isinstance(parsed, dict) and "rating" in parsed:
-                            if verbose:
-                                print("Successfully parsed using regex (single object)")
-                            return [parsed]
-                        elif isinstance(parsed, list) and all("rating" in item for item in parsed):
-                            if verbose:
-                                print(f"Successfully parsed {len(parsed)} items using regex")
-                            return parsed
-                    except json.JSONDecodeError:
-                        pass
+        for source, candidate in _iter_rating_candidates(text):
+            try:
+                # Clean up newlines in the candidate if needed
+                parsed = _loads_collapsing_newlines(candidate)
+            except json.JSONDecodeError:
+                continue
+            items = _rated_items(parsed)
+            if items:
+                if verbose:
+                    print(f"Successfully parsed {len(items)} items from {source}")
+                return items
     except Exception as e:
         if verbose:
-            print(f"Error in regex extraction: {str(e)}")
+            print(f"Error in code block and regex extraction: {str(e)}")
     
     # Method 3: Try using json5 if available (more lenient parser)
     try:
@@ -232,25 +290,27 @@ def parse_ratings(text: str, original_items: List[Dict[str, str]] = None) -> Lis
     try:
         # Try line-by-line parsing for each item
         if original_items and len(original_items) > 0:
-            # Look for patterns that include both the question and rating
+            # Look for patterns that include both the question and rating, scanning
+            # the text once with an alternation of every question (longest first,
+            # so a question that prefixes another does not shadow it)
+            questions = {item.get("question", "") for item in original_items} - {""}
+            alternation = '|'.join(map(re.escape, sorted(questions, key=len, reverse=True)))
+            pattern = re.compile(f'({alternation}).*?"rating"\\s*:\\s*(\\d+(?:\\.\\d+)?)', re.DOTALL)
+            ratings = {}
+            for match in pattern.finditer(text) if questions else ():
+                ratings.setdefault(match.group(1), float(match.group(2)))
+            
             found_items = []
             for item in original_items:
-                # Escape regex special characters in question text
-                question_escaped = re.escape(item.get("question", ""))
-                pattern = f'.*{question_escaped}.*"rating"\\s*:\\s*(\\d+(?:\\.\\d+)?)'
-                match = re.search(pattern, text, re.DOTALL)
-                if match:
-                    try:
-                        rating = float(match.group(1))
-                        found_items.append({
-                            "question": item.get("question", ""),
-                            "answer": item.get("answer", ""),
-                            "rating": rating
-                        })
-                        if verbose:
-                            print(f"Found rating {rating} for question: {item.get('question', '')[:30]}...")
-                    except:
-                        pass
+                rating = ratings.get(item.get("question", ""))
+                if rating is not None:
+                    found_items.append({
+                        "question": item.get("question", ""),
+                        "answer": item.get("answer", ""),
+                        "rating": rating
+                    })
+                    if verbose:
+                        print(f"Found rating {rating} for question: {item.get('question', '')[:30]}...")
             
             if found_items:
                 if verbose:
@@ -274,13 +334,13 @@ def convert_to_conversation_format(qa_pairs: List[Dict[str, str]],
     if system_prompt is None:
         system_prompt = "You are a helpful AI assistant that provides accurate, detailed responses."
     
-    conversations = []
-    for pair in qa_pairs:
-        conversation = [
+    # Each conversation gets its own message dicts so callers can edit one
+    # conversation without affecting the others
+    return [
+        [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": pair["question"]},
             {"role": "assistant", "content": pair["answer"]}
         ]
-        conversations.append(conversation)
-    
-    return conversations
\ No newline at end of file
+        for pair in qa_pairs
+    ]
\ No newline at end of file
@@ -8,29 +8,71 @@ import re
 import json
 from typing import List, Dict, Any
 
+# Use orjson for decoding when it is installed; its JSONDecodeError subclasses
+# json.JSONDecodeError, so the handlers below cover both
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Patterns used on every call, compiled once at import
+_JSON_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_JSON_START_RE = re.compile(r'[\{\[]')
+_JSON_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|[\[\]{}]')
+_JSON_DECODER = json.JSONDecoder()
+
+def _skip_bracketed(text: str, start: int) -> int:
+    """Index just past the bracket matching the one at text[start]
+    
+    Brackets inside string literals are ignored. Returns len(text) if the
+    bracket is never closed.
+    """
+    depth = 0
+    for token in _JSON_TOKEN_RE.finditer(text, start):
+        char = token.group(0)
+        if char in '[{':
+            depth += 1
+        elif char in ']}':
+            depth -= 1
+            if depth == 0:
+                return token.end()
+    return len(text)
+
 def split_into_chunks(text: str, chunk_size: int = 4000, overlap: int = 200) -> List[str]:
     """Split text into chunks with optional overlap"""
     paragraphs = text.split("\n\n")
     chunks = []
-    current_chunk = ""
+    # Paragraphs of the chunk being built and the length they join to, so each
+    # chunk is materialized once instead of being grown by concatenation
+    parts: List[str] = []
+    current_len = 0
     
     for para in paragraphs:
-        if len(current_chunk) + len(para) > chunk_size and current_chunk:
+        if current_len + len(para) > chunk_size and current_len:
+            current_chunk = "\n\n".join(parts)
             chunks.append(current_chunk)
-            # Keep some overlap for context
-            sentences = current_chunk.split('. ')
-            if len(sentences) > 3:
-                current_chunk = '. '.join(sentences[-3:]) + "\n\n" + para
+            # Keep some overlap for context: the last three sentences, found by
+            # searching back for the third-last separator instead of splitting
+            start = len(current_chunk)
+            for _ in range(3):
+                start = current_chunk.rfind('. ', 0, start)
+                if start < 0:
+                    break
+            if start >= 0:
+                parts = [current_chunk[start + 2:], para]
+                current_len = len(parts[0]) + 2 + len(para)
             else:
-                current_chunk = para
+                parts = [para]
+                current_len = len(para)
+        elif current_len:
+            parts.append(para)
+            current_len += 2 + len(para)
         else:
-            if current_chunk:
-                current_chunk += "\n\n" + para
-            else:
-                current_chunk = para
+            parts = [para]
+            current_len = len(para)
     
-    if current_chunk:
-        chunks.append(current_chunk)
+    if current_len:
+        chunks.append("\n\n".join(parts))
     
     return chunks
 
@@ -41,26 +83,27 @@ def extract_json_from_text(text: str) -> Dict[str, Any]:
     # Try to parse as complete JSON
     if text.startswith('{') and text.endswith('}') or text.startswith('[') and text.endswith(']'):
         try:
-            return json.loads(text)
+            return _loads(text)
         except json.JSONDecodeError:
             pass
     
     # Look for JSON within Markdown code blocks
-    json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    match = re.search(json_pattern, text)
+    match = _JSON_CODE_BLOCK_RE.search(text)
     if match:
         try:
-            return json.loads(match.group(1).strip())
+            return _loads(match.group(1).strip())
         except json.JSONDecodeError:
             pass
     
-    # Try a more aggressive pattern
-    json_pattern = r'\{[\s\S]*\}|\[[\s\S]*\]'
-    match = re.search(json_pattern, text)
-    if match:
+    # Try decoding from each top-level opening bracket in turn; raw_decode
+    # stops at the end of the first valid value instead of spanning to the
+    # last bracket. Brackets nested in a malformed value are skipped, so a
+    # fragment of it is never returned as the answer.
+    match = _JSON_START_RE.search(text)
+    while match:
         try:
-            return json.loads(match.group(0))
+            return _JSON_DECODER.raw_decode(text, match.start())[0]
         except json.JSONDecodeError:
-            pass
+            match = _JSON_START_RE.search(text, _skip_bracketed(text, match.start()))
     
     raise ValueError("Could not extract valid JSON from the response")
\ No newline at end of file
@@ -13,6 +13,16 @@ import pytest
 from tests.utils import TempDirectoryManager
 
 
+@pytest.fixture(autouse=True)
+def clear_vllm_server_cache():
+    """Make every test probe its (mocked) vLLM server afresh."""
+    from synthetic_data_kit.models.llm_client import clear_vllm_server_cache
+
+    clear_vllm_server_cache()
+    yield
+    clear_vllm_server_cache()
+
+
 @pytest.fixture
 def sample_data_path():
     """Fixture providing path to the sample data directory."""
@@ -247,6 +257,17 @@ def patch_vllm_config(config_factory):
 # Additional utility fixtures for common test patterns
 
 
+@pytest.fixture
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run the test from a temporary working directory.
+
+    CLI commands write default outputs under ./data, so this keeps them out
+    of the checkout.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
 def temp_output_dir():
     """Create a temporary output directory for tests."""
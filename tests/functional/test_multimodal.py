@@ -8,35 +8,35 @@ import lance
 # URL of a sample PDF with images for testing
 PDF_URL = "https://www.adobe.com/support/products/enterprise/knowledgecenter/media/c4611_sample_explain.pdf"
 PDF_FILENAME = "sample_multimodal.pdf"
-OUTPUT_DIR = "test_output"
 
 @pytest.fixture(scope="module")
-def setup_module():
-    """Download the test PDF and create the output directory."""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def output_dir(tmp_path_factory):
+    """Download the test PDF into a fresh output directory.
+
+    The directory comes from tmp_path_factory, so parallel pytest-xdist workers
+    never share or remove each other's files.
+    """
+    output_dir = str(tmp_path_factory.mktemp("multimodal"))
     response = requests.get(PDF_URL)
-    pdf_path = os.path.join(OUTPUT_DIR, PDF_FILENAME)
+    pdf_path = os.path.join(output_dir, PDF_FILENAME)
     with open(pdf_path, "wb") as f:
         f.write(response.content)
 
-    yield
-
-    # Teardown: remove the created directory and its contents
-    shutil.rmtree(OUTPUT_DIR)
+    return output_dir
 
 def run_cli_command(command):
     """Helper function to run a CLI command and return the output."""
     result = subprocess.run(command, capture_output=True, text=True, check=True)
     return result
 
-def test_ingest_pdf_default(setup_module):
+def test_ingest_pdf_default(output_dir):
     """Test default PDF ingestion (text only)."""
-    pdf_path = os.path.join(OUTPUT_DIR, PDF_FILENAME)
-    output_lance_path = os.path.join(OUTPUT_DIR, "sample_multimodal.lance")
+    pdf_path = os.path.join(output_dir, PDF_FILENAME)
+    output_lance_path = os.path.join(output_dir, "sample_multimodal.lance")
 
     # Run the ingest command
     run_cli_command([
-        "synthetic-data-kit", "ingest", pdf_path, "--output-dir", OUTPUT_DIR
+        "synthetic-data-kit", "ingest", pdf_path, "--output-dir", output_dir
     ])
 
     # Verify the output
@@ -55,10 +55,10 @@ def test_ingest_pdf_default(setup_module):
     text_column = table.column("text")
     assert all(text is not None and len(text.as_py()) > 0 for text in text_column)
 
-def test_ingest_pdf_multimodal(setup_module):
+def test_ingest_pdf_multimodal(output_dir):
     """Test multimodal PDF ingestion (text and images)."""
-    pdf_path = os.path.join(OUTPUT_DIR, PDF_FILENAME)
-    output_lance_path = os.path.join(OUTPUT_DIR, "sample_multimodal.lance")
+    pdf_path = os.path.join(output_dir, PDF_FILENAME)
+    output_lance_path = os.path.join(output_dir, "sample_multimodal.lance")
 
     # Clean up previous run if necessary
     if os.path.exists(output_lance_path):
@@ -66,7 +66,7 @@ def test_ingest_pdf_multimodal(setup_module):
 
     # Run the ingest command with the --multimodal flag
     run_cli_command([
-        "synthetic-data-kit", "ingest", pdf_path, "--output-dir", OUTPUT_DIR, "--multimodal"
+        "synthetic-data-kit", "ingest", pdf_path, "--output-dir", output_dir, "--multimodal"
     ])
 
     # Verify the output
@@ -7,6 +7,8 @@ from unittest.mock import patch
 
 import pytest
 
+pytestmark = pytest.mark.usefixtures("isolated_cwd")
+
 
 @pytest.mark.functional
 def test_ingest_preview_mode(patch_config):
@@ -3,10 +3,12 @@
 import os
 import tempfile
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
+pytestmark = pytest.mark.usefixtures("isolated_cwd")
+
 
 @pytest.mark.integration
 def test_single_file_ingest_still_works(patch_config):
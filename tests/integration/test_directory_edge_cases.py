@@ -3,7 +3,7 @@
 import os
 import tempfile
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
@@ -11,8 +11,7 @@ from synthetic_data_kit.utils.directory_processor import (
     process_directory_ingest,
     process_directory_save_as,
     get_directory_stats,
-    INGEST_EXTENSIONS,
-    SAVE_AS_EXTENSIONS
+    INGEST_EXTENSIONS
 )
 
 
@@ -5,7 +5,9 @@
 # the root directory of this source tree.
 
 import os
+import re
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,6 +17,33 @@ from synthetic_data_kit.parsers.ppt_parser import PPTParser
 from synthetic_data_kit.parsers.youtube_parser import YouTubeParser
 
 
+# Metadata and transcript lines expected from the mocked YouTube video, in order
+YOUTUBE_RESULT_PATTERN = re.compile(
+    r"Title: Test Video Title[\s\S]*Author: Test Author[\s\S]*Length: 120 seconds"
+    r"[\s\S]*https://www\.youtube\.com/watch\?v=test_video_id[\s\S]*Transcript:"
+    r"[\s\S]*Hello everyone[\s\S]*Welcome to this video[\s\S]*Today we'll learn about testing"
+)
+
+
+class _MockShapes(list):
+    """Plain list of slide shapes that also exposes the title shape, like pptx's SlideShapes"""
+
+    def __init__(self, shapes, title):
+        super().__init__(shapes)
+        self.title = title
+
+
+def _make_mock_slide(title, texts):
+    """Build a stub pptx slide whose shapes hold ``texts``, led by an optional title shape"""
+    shapes = [SimpleNamespace(text=text) for text in texts]
+    title_shape = None
+    if title is not None:
+        title_shape = SimpleNamespace(text=title)
+        shapes.insert(0, title_shape)
+
+    return SimpleNamespace(shapes=_MockShapes(shapes, title_shape))
+
+
 class TestDOCXParser:
     """Test cases for DOCX parser"""
 
@@ -93,6 +122,17 @@ class TestDOCXParser:
 class TestPPTParser:
     """Test cases for PowerPoint parser"""
 
+    # Text extracted from the two mock slides, with a blank line between slides
+    EXPECTED_TEXT = (
+        "--- Slide 1 ---\n"
+        "Title: Slide 1 Title\n"
+        "Slide 1 Title\n"
+        "Slide 1 content\n"
+        "\n"
+        "--- Slide 2 ---\n"
+        "Slide 2 content"
+    )
+
     def test_ppt_parser_initialization(self):
         """Test that PPT parser can be initialized"""
         parser = PPTParser()
@@ -109,43 +149,17 @@ class TestPPTParser:
         mock_pptx.Presentation = mock_presentation_class
         mock_import.return_value = mock_pptx
 
-        # Mock slide 1
-        mock_slide1 = MagicMock()
-        mock_title1 = MagicMock()
-        mock_title1.text = "Slide 1 Title"
-
-        # Setup shapes collection with title attribute
-        mock_shapes1 = MagicMock()
-        mock_shapes1.title = mock_title1
-        mock_shapes1.__iter__ = lambda self: iter([mock_title1, MagicMock(text="Slide 1 content")])
-        mock_slide1.shapes = mock_shapes1
-
-        # Mock slide 2 (no title)
-        mock_slide2 = MagicMock()
-        mock_shapes2 = MagicMock()
-        mock_shapes2.title = None
-        mock_shape2 = MagicMock()
-        mock_shape2.text = "Slide 2 content"
-        mock_shapes2.__iter__ = lambda self: iter([mock_shape2])
-        mock_slide2.shapes = mock_shapes2
-
-        mock_prs.slides = [mock_slide1, mock_slide2]
+        # Slide 1 has a title, slide 2 does not
+        mock_prs.slides = [
+            _make_mock_slide("Slide 1 Title", ["Slide 1 content"]),
+            _make_mock_slide(None, ["Slide 2 content"]),
+        ]
 
         # Test parsing
         parser = PPTParser()
         result = parser.parse("/fake/path.pptx")
 
-        expected_lines = [
-            "--- Slide 1 ---",
-            "Title: Slide 1 Title",
-            "Slide 1 Title",
-            "Slide 1 content",
-            "",  # Empty line between slides
-            "--- Slide 2 ---",
-            "Slide 2 content",
-        ]
-        expected = "\n\n".join(["\n".join(expected_lines[:4]), "\n".join(expected_lines[5:])])
-        assert result == [{"text": expected}]
+        assert result == [{"text": self.EXPECTED_TEXT}]
         # Verify pptx import was called
         import_calls = [call[0][0] for call in mock_import.call_args_list if call[0]]
         assert "pptx" in import_calls
@@ -217,15 +231,8 @@ class TestYouTubeParser:
         test_url = "https://www.youtube.com/watch?v=test_video_id"
         result = parser.parse(test_url)
 
-        # Verify the result structure
-        assert "Title: Test Video Title" in result
-        assert "Author: Test Author" in result
-        assert "Length: 120 seconds" in result
-        assert test_url in result
-        assert "Transcript:" in result
-        assert "Hello everyone" in result
-        assert "Welcome to this video" in result
-        assert "Today we'll learn about testing" in result
+        # Verify the result structure: metadata header, then the transcript in order
+        assert YOUTUBE_RESULT_PATTERN.search(result)
 
         # Verify imports were called
         import_calls = [call[0][0] for call in mock_import.call_args_list]
@@ -309,3 +316,33 @@ class TestYouTubeParser:
         assert "Author: Test Author" in result
         assert "Length: 0 seconds" in result
         assert "Transcript:" in result
+
+
+@pytest.mark.unit
+def test_ppt_presentation_reused_until_modified(tmp_path):
+    """Test that an unchanged PPTX is only opened once across parsers"""
+    from pptx import Presentation
+
+    from synthetic_data_kit.parsers.multimodal_parser import MultimodalParser
+
+    pptx_path = tmp_path / "deck.pptx"
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Cached deck"
+    prs.save(pptx_path)
+
+    with patch("pptx.Presentation", wraps=Presentation) as mock_presentation:
+        text = PPTParser().parse(str(pptx_path))
+        rows = MultimodalParser().parse(str(pptx_path))
+        assert mock_presentation.call_count == 1
+
+        # Rewriting the file invalidates the cached presentation
+        slide.shapes.title.text = "Edited deck"
+        prs.save(pptx_path)
+        os.utime(pptx_path, ns=(0, os.stat(pptx_path).st_mtime_ns + 1))
+        edited = PPTParser().parse(str(pptx_path))
+        assert mock_presentation.call_count == 2
+
+    assert "Cached deck" in text[0]["text"]
+    assert "Cached deck" in rows[0]["text"]
+    assert "Edited deck" in edited[0]["text"]
@@ -0,0 +1,127 @@
+"""Unit tests for Lance dataset utilities."""
+
+import os
+
+import pyarrow as pa
+import pytest
+
+from synthetic_data_kit.utils.lance_utils import create_lance_dataset, load_lance_dataset
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_multiple_batches(tmp_path):
+    """Test that rows spanning several record batches are written in order."""
+    schema = pa.schema([pa.field("text", pa.string()), pa.field("image", pa.binary())])
+    data = [
+        {"text": f"Row {i}", "image": bytes([i]) if i % 2 else None}
+        for i in range(10)
+    ]
+    output_path = str(tmp_path / "rows.lance")
+
+    create_lance_dataset(data, output_path, schema=schema, batch_size=3)
+
+    dataset = load_lance_dataset(output_path)
+    assert dataset.count_rows() == 10
+    assert dataset.to_table().to_pylist() == data
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_infers_schema(tmp_path):
+    """Test that the schema is inferred when not provided."""
+    output_path = str(tmp_path / "inferred.lance")
+
+    create_lance_dataset([{"text": "hello"}, {"text": "world"}], output_path)
+
+    dataset = load_lance_dataset(output_path)
+    assert dataset.schema.names == ["text"]
+    assert dataset.to_table().column("text").to_pylist() == ["hello", "world"]
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_empty(tmp_path):
+    """Test that no dataset is written for empty input."""
+    output_path = str(tmp_path / "empty.lance")
+
+    create_lance_dataset([], output_path)
+
+    assert not os.path.exists(output_path)
+    assert load_lance_dataset(output_path) is None
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_from_generator(tmp_path):
+    """Test that rows can be streamed from a generator without a schema."""
+    data = [{"text": f"Row {i}"} for i in range(5)]
+    output_path = str(tmp_path / "streamed.lance")
+
+    create_lance_dataset((row for row in data), output_path, batch_size=2)
+
+    dataset = load_lance_dataset(output_path)
+    assert dataset.to_table().to_pylist() == data
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_empty_generator(tmp_path):
+    """Test that an exhausted iterator writes nothing."""
+    output_path = str(tmp_path / "empty_gen.lance")
+
+    create_lance_dataset(iter([]), output_path)
+
+    assert not os.path.exists(output_path)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text_type", [pa.string(), pa.large_string()])
+def test_create_lance_dataset_string_buffers(tmp_path, text_type):
+    """Test that text columns built from raw buffers round-trip exactly."""
+    schema = pa.schema([pa.field("text", text_type)])
+    data = [{"text": "plain"}, {"text": "ünïcödé ✓"}, {"text": ""}, {"text": None}, {"text": "x" * 10000}]
+    output_path = str(tmp_path / "strings.lance")
+
+    create_lance_dataset(data, output_path, schema=schema, batch_size=2)
+
+    dataset = load_lance_dataset(output_path)
+    assert dataset.schema.field("text").type == text_type
+    assert dataset.to_table().to_pylist() == data
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_multimodal_schema(tmp_path):
+    """Test that the ingest schema's column encodings round-trip text and images."""
+    from synthetic_data_kit.utils.lance_utils import MULTIMODAL_SCHEMA
+
+    data = [
+        {"text": "Page one " * 100, "image": os.urandom(4096)},
+        {"text": "Page two", "image": None},
+    ]
+    output_path = str(tmp_path / "multimodal.lance")
+
+    create_lance_dataset(data, output_path, schema=MULTIMODAL_SCHEMA)
+
+    dataset = load_lance_dataset(output_path)
+    assert dataset.to_table().to_pylist() == data
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_max_rows_per_file(tmp_path):
+    """Test that write tuning options are passed through to Lance."""
+    data = [{"text": f"Row {i}"} for i in range(10)]
+    output_path = str(tmp_path / "split.lance")
+
+    create_lance_dataset(data, output_path, max_rows_per_group=2, max_rows_per_file=4)
+
+    dataset = load_lance_dataset(output_path)
+    assert len(dataset.get_fragments()) == 3
+    assert dataset.to_table().to_pylist() == data
+
+
+@pytest.mark.unit
+def test_create_lance_dataset_storage_version(tmp_path):
+    """Test that datasets are written with the pinned Lance file format."""
+    from synthetic_data_kit.utils.lance_utils import LANCE_STORAGE_VERSION
+
+    output_path = str(tmp_path / "versioned.lance")
+
+    create_lance_dataset([{"text": "Row"}], output_path)
+
+    assert load_lance_dataset(output_path).data_storage_version == LANCE_STORAGE_VERSION
@@ -1,5 +1,8 @@
 """Unit tests for LLM client."""
 
+import subprocess
+import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,22 +10,30 @@ import pytest
 from synthetic_data_kit.models.llm_client import LLMClient
 
 
-@pytest.mark.unit
-def test_llm_client_initialization(patch_config, test_env):
-    """Test LLM client initialization with API endpoint provider."""
+@pytest.fixture
+def mock_openai():
+    """Patch the OpenAI class; its client's completions return a canned response."""
     with patch("synthetic_data_kit.models.llm_client.OpenAI") as mock_openai:
-        mock_client = MagicMock()
-        mock_openai.return_value = mock_client
+        message = SimpleNamespace(content="This is a test response")
+        completions = mock_openai.return_value.chat.completions
+        completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=message)]
+        )
+        yield mock_openai
 
-        # Initialize client
-        client = LLMClient(provider="api-endpoint")
 
-        # Check that the client was initialized correctly
-        assert client.provider == "api-endpoint"
-        assert client.api_base is not None
-        assert client.model is not None
-        # Check that OpenAI client was initialized
-        assert mock_openai.called
+@pytest.mark.unit
+def test_llm_client_initialization(patch_config, test_env, mock_openai):
+    """Test LLM client initialization with API endpoint provider."""
+    # Initialize client
+    client = LLMClient(provider="api-endpoint")
+
+    # Check that the client was initialized correctly
+    assert client.provider == "api-endpoint"
+    assert client.api_base is not None
+    assert client.model is not None
+    # Check that OpenAI client was initialized
+    assert mock_openai.called
 
 
 @pytest.mark.unit
@@ -46,54 +57,64 @@ def test_llm_client_vllm_initialization(patch_config, test_env):
 
 
 @pytest.mark.unit
-def test_llm_client_chat_completion(patch_config, test_env):
-    """Test LLM client chat completion with API endpoint provider."""
-    with patch("synthetic_data_kit.models.llm_client.OpenAI") as mock_openai:
-        # Create a proper mock chain for OpenAI client
-        mock_client = MagicMock()
-        mock_chat = MagicMock()
-        mock_completions = MagicMock()
-        mock_create = MagicMock()
-
-        # Setup the nested mock structure
-        mock_openai.return_value = mock_client
-        mock_client.chat = mock_chat
-        mock_chat.completions = mock_completions
-        mock_completions.create = mock_create
-
-        # Setup mock response
+def test_llm_client_vllm_server_checked_once(patch_config, test_env):
+    """Test that clients for the same vLLM server reuse a successful check."""
+    with patch("requests.get") as mock_get:
         mock_response = MagicMock()
-        mock_choice = MagicMock()
-        mock_message = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = ["mock-model"]
+        mock_get.return_value = mock_response
 
-        mock_message.content = "This is a test response"
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
+        LLMClient(provider="vllm")
+        LLMClient(provider="vllm")
 
-        # Connect the create function to return our mock response
-        mock_create.return_value = mock_response
+        mock_get.assert_called_once()
 
-        # Initialize client
-        client = LLMClient(provider="api-endpoint")
 
-        # Test chat completion
-        messages = [
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": "What is synthetic data?"},
-        ]
+@pytest.mark.unit
+def test_llm_client_vllm_server_check_expires(patch_config, test_env, monkeypatch):
+    """Test that an expired server check is repeated and can fail."""
+    from synthetic_data_kit.models import llm_client
 
-        response = client.chat_completion(messages, temperature=0.7)
+    monkeypatch.setattr(llm_client, "VLLM_SERVER_CHECK_TTL", 0)
+    with patch("requests.get") as mock_get:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = ["mock-model"]
+        mock_get.return_value = mock_response
+        LLMClient(provider="vllm")
 
-        # Check that the response is correct
-        assert response == "This is a test response"
-        # Check that OpenAI client was called
-        assert mock_create.called
+        mock_response.status_code = 503
+        with pytest.raises(ConnectionError):
+            LLMClient(provider="vllm")
+
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.unit
+def test_llm_client_chat_completion(patch_config, test_env, mock_openai):
+    """Test LLM client chat completion with API endpoint provider."""
+    # Initialize client
+    client = LLMClient(provider="api-endpoint")
+
+    # Test chat completion
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "What is synthetic data?"},
+    ]
+
+    response = client.chat_completion(messages, temperature=0.7)
+
+    # Check that the response is correct
+    assert response == "This is a test response"
+    # Check that OpenAI client was called
+    assert mock_openai.return_value.chat.completions.create.called
 
 
 @pytest.mark.unit
 def test_llm_client_vllm_chat_completion(patch_config, test_env):
     """Test LLM client chat completion with vLLM provider."""
-    with patch("requests.post") as mock_post, patch("requests.get") as mock_get:
+    with patch("requests.Session.post") as mock_post, patch("requests.get") as mock_get:
         # Mock vLLM server check
         mock_check_response = MagicMock()
         mock_check_response.status_code = 200
@@ -123,3 +144,25 @@ def test_llm_client_vllm_chat_completion(patch_config, test_env):
         assert response == "This is a test response"
         # Check that vLLM API was called
         assert mock_post.called
+
+
+@pytest.mark.unit
+def test_llm_client_import_defers_openai():
+    """Test that importing the LLM client does not import the OpenAI SDK."""
+    code = (
+        "import sys, synthetic_data_kit.models.llm_client; "
+        "sys.exit('openai' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@pytest.mark.unit
+def test_package_exposes_llm_client_lazily():
+    """Test that LLMClient is only imported when accessed from the package."""
+    code = (
+        "import sys, synthetic_data_kit as sdk; "
+        "assert 'synthetic_data_kit.models.llm_client' not in sys.modules; "
+        "from synthetic_data_kit.models.llm_client import LLMClient; "
+        "sys.exit(sdk.LLMClient is not LLMClient)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
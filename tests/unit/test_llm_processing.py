@@ -84,3 +84,128 @@ def test_convert_to_conversation_format():
 
     # Check second conversation
     assert conversations[1][1]["content"] == "Why use synthetic data?"
+
+
+@pytest.mark.unit
+def test_convert_to_conversation_format_messages_are_independent():
+    """Test that editing one conversation's system prompt leaves the others alone."""
+    qa_pairs = [{"question": "Q1", "answer": "A1"}, {"question": "Q2", "answer": "A2"}]
+
+    conversations = llm_processing.convert_to_conversation_format(qa_pairs, "Be brief.")
+    conversations[0][0]["content"] = "Be detailed."
+
+    assert conversations[1][0] == {"role": "system", "content": "Be brief."}
+
+
+@pytest.mark.unit
+def test_parse_qa_pairs_without_question_key():
+    """Test that output without any question key yields no pairs."""
+    text = 'Sorry, I cannot help with that. {"answer": "no question here"}'
+
+    assert llm_processing.parse_qa_pairs(text) == []
+
+
+@pytest.mark.unit
+def test_parse_qa_pairs_cleans_up_malformed_json():
+    """Test that raw newlines and trailing commas are cleaned up before parsing."""
+    text = '[{"question": "What is\n   synthetic data?", "answer": "Generated data.",},]'
+
+    result = llm_processing.parse_qa_pairs(text)
+
+    assert result == [{"question": "What is synthetic data?", "answer": "Generated data."}]
+
+
+@pytest.mark.unit
+def test_parse_ratings_from_code_block():
+    """Test parsing ratings from a code block surrounded by bracketed prose."""
+    text = """Ratings below:
+```json
+[{"question": "Q1", "answer": "A1", "rating": 8}]
+```
+Note: [see {docs}]"""
+
+    result = llm_processing.parse_ratings(text)
+
+    assert result == [{"question": "Q1", "answer": "A1", "rating": 8}]
+
+
+@pytest.mark.unit
+def test_parse_ratings_invalid_raises():
+    """Test that responses without ratings raise ValueError."""
+    with pytest.raises(ValueError, match="Could not parse JSON with ratings"):
+        llm_processing.parse_ratings("I could not rate these pairs.")
+
+
+@pytest.mark.unit
+def test_parse_ratings_matches_each_question_to_its_rating():
+    """Test the last-resort fallback pairs each question with the rating after it."""
+    items = [
+        {"question": "What is A?", "answer": "A"},
+        {"question": "What is B?", "answer": "B"},
+    ]
+    text = 'What is A? -> "rating": 7\nWhat is B? -> "rating": 9'
+
+    result = llm_processing.parse_ratings(text, items)
+
+    assert result == [
+        {"question": "What is A?", "answer": "A", "rating": 7.0},
+        {"question": "What is B?", "answer": "B", "rating": 9.0},
+    ]
+
+
+@pytest.mark.unit
+def test_parse_qa_pairs_regex_decodes_escapes():
+    """Test that the regex fallback decodes JSON escapes in questions and answers."""
+    text = r'''{"question": "Say \"café\"?", "answer": "Line one\nLine two"}
+{"question": "Raw
+newline?", "answer": "Kept \"as is\""}'''
+
+    result = llm_processing.parse_qa_pairs(text)
+
+    assert result == [
+        {"question": 'Say "café"?', "answer": "Line one\nLine two"},
+        {"question": "Raw\nnewline?", "answer": 'Kept "as is"'},
+    ]
+
+
+@pytest.mark.unit
+def test_parse_ratings_ignores_trailing_braces():
+    """Test that prose with braces after a rated object does not break parsing."""
+    text = '{"question": "Why \\"synthetic\\"?", "answer": "A", "rating": 8} (scale {1-10})'
+
+    result = llm_processing.parse_ratings(text)
+
+    assert result == [{"question": 'Why "synthetic"?', "answer": "A", "rating": 8}]
+
+
+@pytest.mark.unit
+def test_parse_ratings_skips_citation_before_array():
+    """Test that a bracketed citation before the rated array is not taken as the answer."""
+    text = (
+        'Scores use scale [1]: [{"question": "Q", "answer": "A", "rating": 8}, '
+        '{"question": "Q2", "answer": "A2", "rating": 7}]'
+    )
+
+    result = llm_processing.parse_ratings(text)
+
+    assert result == [
+        {"question": "Q", "answer": "A", "rating": 8},
+        {"question": "Q2", "answer": "A2", "rating": 7},
+    ]
+
+
+@pytest.mark.unit
+def test_parse_ratings_code_block_after_citation():
+    """Test that a rated code block is still found after a bracketed citation."""
+    text = (
+        "(see [3])\n```json\n"
+        '[{"question": "Q", "answer": "A", "rating": 8}, '
+        '{"question": "Q2", "answer": "A2", "rating": 7}]\n```'
+    )
+
+    result = llm_processing.parse_ratings(text)
+
+    assert result == [
+        {"question": "Q", "answer": "A", "rating": 8},
+        {"question": "Q2", "answer": "A2", "rating": 7},
+    ]
@@ -1,6 +1,7 @@
 """Unit tests for document parsers."""
 
 import os
+import shutil
 import tempfile
 from unittest.mock import MagicMock, patch
 
@@ -10,110 +11,107 @@ from synthetic_data_kit.parsers.html_parser import HTMLParser
 from synthetic_data_kit.parsers.pdf_parser import PDFParser
 from synthetic_data_kit.parsers.txt_parser import TXTParser
 
+# Sample page shared by the HTML parser tests
+SAMPLE_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Test Page</title>
+</head>
+<body>
+    <h1>Test Heading</h1>
+    <p>This is sample HTML content for testing.</p>
+</body>
+</html>
+"""
+
 
 @pytest.mark.unit
-def test_txt_parser():
+def test_txt_parser(tmp_path):
     """Test TXT parser."""
     # Create a temporary text file
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".txt", delete=False) as f:
-        f.write("This is sample text content for testing.")
-        file_path = f.name
+    file_path = tmp_path / "sample.txt"
+    file_path.write_text("This is sample text content for testing.")
 
-    try:
-        # Initialize parser
-        parser = TXTParser()
+    # Initialize parser
+    parser = TXTParser()
 
-        # Parse the file
-        content = parser.parse(file_path)
+    # Parse the file
+    content = parser.parse(str(file_path))
 
-        # Check that content was extracted correctly
-        assert content == [{"text": "This is sample text content for testing."}]
+    # Check that content was extracted correctly
+    assert content == [{"text": "This is sample text content for testing."}]
 
-        # Convert content to str
-        text_content = "\n".join([item["text"] for item in content])
+    # Convert content to str
+    text_content = "\n".join([item["text"] for item in content])
 
-        # Test saving content
-        output_path = os.path.join(tempfile.gettempdir(), "output.txt")
-        parser.save(text_content, output_path)
+    # Test saving content
+    output_path = tmp_path / "output.txt"
+    parser.save(text_content, str(output_path))
 
-        # Check that the file was saved correctly
-        with open(output_path) as f:
-            saved_content = f.read()
+    # Check that the file was saved correctly
+    assert output_path.read_text() == text_content
 
-        assert saved_content == text_content
-    finally:
-        # Clean up
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "raw",
+    [b"", b"line one\r\nline two\rline three\n", "caf\u00e9 \u2713\n".encode("utf-8")],
+)
+def test_txt_parser_matches_text_mode_read(tmp_path, raw):
+    """Test that TXT parsing matches a text-mode read, including newlines."""
+    file_path = tmp_path / "sample.txt"
+    file_path.write_bytes(raw)
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        expected = f.read()
+
+    assert TXTParser().parse(str(file_path)) == [{"text": expected}]
 
 
 @pytest.mark.unit
-def test_html_parser():
+def test_html_parser(tmp_path):
     """Test HTML parser."""
     # Create a temporary HTML file
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Test Page</title>
-    </head>
-    <body>
-        <h1>Test Heading</h1>
-        <p>This is sample HTML content for testing.</p>
-    </body>
-    </html>
-    """
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".html", delete=False) as f:
-        f.write(html_content)
-        file_path = f.name
-
-    output_path = os.path.join(tempfile.gettempdir(), "output.txt")
-
-    try:
-        # Mock bs4.BeautifulSoup (since it's imported inside the method)
-        with patch("bs4.BeautifulSoup") as mock_bs:
-            mock_soup = MagicMock()
-            mock_soup.get_text.return_value = (
-                "Test Heading\nThis is sample HTML content for testing."
-            )
-            mock_bs.return_value = mock_soup
-
-            # Initialize parser
-            parser = HTMLParser()
-
-            # Parse the file
-            content = parser.parse(file_path)
-
-            # Check that BeautifulSoup was called
-            mock_bs.assert_called_once()
-
-            # Check that content extraction method was called
-            mock_soup.get_text.assert_called_once()
-
-            # Test saving content
-            parser.save(content, output_path)
+    file_path = tmp_path / "sample.html"
+    file_path.write_text(SAMPLE_HTML, encoding="utf-8")
 
-            # Check that the file was saved correctly
-            with open(output_path) as f:
-                saved_content = f.read()
+    # Mock bs4.BeautifulSoup (since it's imported inside the method)
+    with patch("bs4.BeautifulSoup") as mock_bs:
+        mock_soup = MagicMock()
+        mock_soup.get_text.return_value = "Test Heading\nThis is sample HTML content for testing."
+        mock_bs.return_value = mock_soup
+
+        # Initialize parser
+        parser = HTMLParser()
+
+        # Parse the file
+        content = parser.parse(str(file_path))
+
+        # Check that BeautifulSoup was called
+        mock_bs.assert_called_once()
+
+        # Check that content extraction method was called
+        mock_soup.get_text.assert_called_once()
+
+        # Test saving content
+        output_path = tmp_path / "output.txt"
+        parser.save(content, str(output_path))
 
-            assert saved_content == content
-    finally:
-        # Clean up
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+        # Check that the file was saved correctly
+        assert output_path.read_text() == content
 
 
 @pytest.mark.unit
 def test_pdf_parser():
     """Test PDF parser."""
-    # Mock pdfminer.high_level.extract_text (since it's imported inside the method)
-    with patch("pdfminer.high_level.extract_text") as mock_extract:
-        mock_extract.return_value = "This is sample PDF content for testing."
+    # Mock pymupdf.open (since it's imported inside the method)
+    with patch("pymupdf.open") as mock_open:
+        mock_page1 = MagicMock()
+        mock_page1.get_text.return_value = [(0, 0, 100, 20, "This is sample PDF content\n", 0, 0)]
+        mock_page2 = MagicMock()
+        mock_page2.get_text.return_value = [(0, 0, 100, 20, "for testing.\n", 0, 0)]
+        mock_open.return_value.__enter__.return_value = [mock_page1, mock_page2]
 
         # Create a dummy file path
         file_path = "/dummy/path/to/file.pdf"
@@ -124,11 +122,11 @@ def test_pdf_parser():
         # Parse the file
         content = parser.parse(file_path)
 
-        # Check that extract_text was called
-        mock_extract.assert_called_once_with(file_path)
+        # Check that the document was opened
+        mock_open.assert_called_once_with(file_path)
 
-        # Check that content matches our mock return value
-        assert content == [{"text": "This is sample PDF content for testing."}]
+        # Check that page texts are joined in order
+        assert content == [{"text": "This is sample PDF content\n\nfor testing."}]
 
         # Test saving content
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -139,4 +137,441 @@ def test_pdf_parser():
             with open(output_path) as f:
                 saved_content = f.read()
 
-            assert saved_content == "This is sample PDF content for testing."
+            assert saved_content == "This is sample PDF content\n\nfor testing."
+
+
+@pytest.mark.unit
+def test_pdf_parser_keeps_paragraph_breaks(tmp_path):
+    """Test that text blocks on one page are separated by blank lines for chunking."""
+    import pymupdf
+
+    pdf_path = str(tmp_path / "paragraphs.pdf")
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_textbox(pymupdf.Rect(50, 50, 500, 150), "First paragraph.")
+    page.insert_textbox(pymupdf.Rect(50, 200, 500, 300), "Second paragraph.")
+    doc.save(pdf_path)
+    doc.close()
+
+    content = PDFParser().parse(pdf_path)
+
+    assert content == [{"text": "First paragraph.\n\nSecond paragraph."}]
+
+
+@pytest.mark.unit
+def test_pdf_parser_pdfminer_engine():
+    """Test PDF parser with the pdfminer fallback engine."""
+    # Mock pdfminer.high_level.extract_text (since it's imported inside the method)
+    with patch("pdfminer.high_level.extract_text") as mock_extract, patch(
+        "synthetic_data_kit.parsers.pdf_parser._pdfminer_page_count", return_value=2
+    ):
+        mock_extract.return_value = "This is sample PDF content for testing."
+
+        file_path = "/dummy/path/to/file.pdf"
+        parser = PDFParser(engine="pdfminer")
+        content = parser.parse(file_path)
+
+        mock_extract.assert_called_once_with(file_path, laparams=None)
+        assert content == [{"text": "This is sample PDF content for testing."}]
+
+
+@pytest.mark.unit
+def test_pdf_parser_pdfminer_fast_layout(tmp_path):
+    """Test that fast layout skips box ordering but keeps the text."""
+    import pdfminer.high_level
+    import pymupdf
+
+    pdf_path = str(tmp_path / "layout.pdf")
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "Heading")
+    page.insert_text((50, 80), "Body text")
+    doc.save(pdf_path)
+    doc.close()
+
+    with patch("pdfminer.high_level.extract_text", wraps=pdfminer.high_level.extract_text) as mock_extract:
+        content = PDFParser(engine="pdfminer", fast_layout=True).parse(pdf_path)
+
+    assert mock_extract.call_args.kwargs["laparams"].boxes_flow is None
+    assert "Heading" in content[0]["text"]
+    assert "Body text" in content[0]["text"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", ["pymupdf", "pdfminer"])
+def test_pdf_parser_parallel_matches_serial(tmp_path, monkeypatch, engine):
+    """Test that splitting PDF pages across workers gives identical text."""
+    import pymupdf
+
+    from synthetic_data_kit.parsers import pdf_parser
+
+    pdf_path = str(tmp_path / "pages.pdf")
+    doc = pymupdf.open()
+    for i in range(6):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i}")
+    doc.save(pdf_path)
+    doc.close()
+
+    serial = PDFParser(engine=engine).parse(pdf_path)
+
+    monkeypatch.setattr(pdf_parser, "MIN_PAGES_PER_WORKER", 1)
+    monkeypatch.setattr(pdf_parser.os, "cpu_count", lambda: 3)
+    parallel = PDFParser(engine=engine).parse(pdf_path)
+
+    assert parallel == serial
+    assert "Page 5" in parallel[0]["text"]
+
+
+@pytest.mark.unit
+def test_pdf_parser_parallel_spawns_workers(tmp_path, monkeypatch):
+    """Test that PDF worker processes are spawned, not forked."""
+    import pymupdf
+
+    from synthetic_data_kit.parsers import pdf_parser
+
+    pdf_path = str(tmp_path / "pages.pdf")
+    doc = pymupdf.open()
+    for i in range(2):
+        doc.new_page().insert_text((50, 50), f"Page {i}")
+    doc.save(pdf_path)
+    doc.close()
+
+    contexts = []
+    real_executor = pdf_parser.ProcessPoolExecutor
+
+    def recording_executor(**kwargs):
+        contexts.append(kwargs["mp_context"])
+        return real_executor(**kwargs)
+
+    monkeypatch.setattr(pdf_parser, "ProcessPoolExecutor", recording_executor)
+    monkeypatch.setattr(pdf_parser, "MIN_PAGES_PER_WORKER", 1)
+    monkeypatch.setattr(pdf_parser.os, "cpu_count", lambda: 2)
+    content = PDFParser().parse(pdf_path)
+
+    assert [context.get_start_method() for context in contexts] == ["spawn"]
+    assert "Page 1" in content[0]["text"]
+
+
+@pytest.mark.unit
+def test_pdf_parser_invalid_engine():
+    """Test that an unknown PDF engine is rejected."""
+    with pytest.raises(ValueError, match="Unsupported PDF engine"):
+        PDFParser(engine="unknown")
+
+
+@pytest.mark.unit
+def test_multimodal_pdf_parallel_matches_serial(tmp_path, monkeypatch):
+    """Test that splitting PDF pages across workers preserves page order."""
+    import pymupdf
+
+    from synthetic_data_kit.parsers import multimodal_parser
+    from synthetic_data_kit.parsers.multimodal_parser import MultimodalParser
+
+    pdf_path = str(tmp_path / "pages.pdf")
+    doc = pymupdf.open()
+    for i in range(6):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i}")
+    doc.save(pdf_path)
+    doc.close()
+
+    serial = MultimodalParser().parse(pdf_path)
+
+    monkeypatch.setattr(multimodal_parser, "MIN_PAGES_PER_WORKER", 1)
+    monkeypatch.setattr(multimodal_parser.os, "cpu_count", lambda: 3)
+    parallel = MultimodalParser().parse(pdf_path)
+
+    assert parallel == serial
+    assert [item["text"].strip() for item in parallel] == [f"Page {i}" for i in range(6)]
+
+
+@pytest.mark.unit
+def test_multimodal_pdf_parallel_bounds_pages_in_flight(tmp_path, monkeypatch):
+    """Test that parallel parsing keeps at most one page range per worker in flight."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pymupdf
+
+    from synthetic_data_kit.parsers import multimodal_parser
+    from synthetic_data_kit.parsers.multimodal_parser import MultimodalParser
+
+    pdf_path = str(tmp_path / "pages.pdf")
+    doc = pymupdf.open()
+    for i in range(6):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i}")
+    doc.save(pdf_path)
+    doc.close()
+
+    submitted = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers, mp_context=None):
+            super().__init__(max_workers=max_workers)
+
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[1:])
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(multimodal_parser, "ProcessPoolExecutor", CountingExecutor)
+    monkeypatch.setattr(multimodal_parser, "MIN_PAGES_PER_WORKER", 1)
+    monkeypatch.setattr(multimodal_parser.os, "cpu_count", lambda: 2)
+
+    rows = MultimodalParser().parse_iter(pdf_path)
+    assert next(rows)["text"].strip() == "Page 0"
+    # Two ranges started, plus one refill after the first result was taken
+    assert submitted == [(0, 1), (1, 2), (2, 3)]
+
+    assert [row["text"].strip() for row in rows] == [f"Page {i}" for i in range(1, 6)]
+    assert len(submitted) == 6
+
+
+@pytest.mark.unit
+def test_html_parser_url_reuses_session():
+    """Test that URL fetches go through the shared HTTP session."""
+    from synthetic_data_kit.parsers import html_parser
+
+    mock_response = MagicMock()
+    mock_response.text = "<html><body><p>Remote page</p></body></html>"
+
+    with patch.object(html_parser._session, "get", return_value=mock_response) as mock_get:
+        parser = HTMLParser()
+        first = parser.parse("https://example.com/a")
+        second = parser.parse("https://example.com/b")
+
+    assert first == second == "Remote page"
+    assert [c.args[0] for c in mock_get.call_args_list] == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+
+
+@pytest.mark.unit
+def test_multimodal_parse_iter_is_lazy(tmp_path):
+    """Test that parse_iter yields the same rows as parse, one at a time."""
+    import types
+
+    import pymupdf
+
+    from synthetic_data_kit.parsers.multimodal_parser import MultimodalParser
+
+    pdf_path = str(tmp_path / "lazy.pdf")
+    doc = pymupdf.open()
+    for i in range(3):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i}")
+    doc.save(pdf_path)
+    doc.close()
+
+    rows = MultimodalParser().parse_iter(pdf_path)
+
+    assert isinstance(rows, types.GeneratorType)
+    assert list(rows) == MultimodalParser().parse(pdf_path)
+
+
+@pytest.mark.unit
+def test_html_parser_caches_unchanged_files(tmp_path):
+    """Test that unchanged local HTML files are only parsed once."""
+    html_path = tmp_path / "cached.html"
+    html_path.write_text("<html><body><p>First version</p></body></html>", encoding="utf-8")
+
+    parser = HTMLParser()
+    with patch("bs4.BeautifulSoup", wraps=__import__("bs4").BeautifulSoup) as mock_bs:
+        assert parser.parse(str(html_path)) == "First version"
+        assert parser.parse(str(html_path)) == "First version"
+        assert mock_bs.call_count == 1
+
+        html_path.write_text("<html><body><p>Second version, edited</p></body></html>", encoding="utf-8")
+        assert parser.parse(str(html_path)) == "Second version, edited"
+        assert mock_bs.call_count == 2
+
+
+@pytest.mark.unit
+def test_save_to_bare_filename(tmp_path, monkeypatch):
+    """Test that saving to a filename in the current directory works."""
+    monkeypatch.chdir(tmp_path)
+
+    TXTParser().save("Saved text", "output.txt")
+
+    assert (tmp_path / "output.txt").read_text() == "Saved text"
+
+
+@pytest.mark.unit
+def test_save_recreates_removed_directory(tmp_path):
+    """Test that saving works again after the output directory is removed."""
+    output_dir = tmp_path / "parsed"
+    parser = TXTParser()
+
+    parser.save("First", str(output_dir / "first.txt"))
+    shutil.rmtree(output_dir)
+    parser.save("Second", str(output_dir / "second.txt"))
+
+    assert (output_dir / "second.txt").read_text() == "Second"
+
+
+@pytest.mark.unit
+def test_multimodal_pdf_shared_image_extracted_once(tmp_path):
+    """Test that an image reused across pages is only extracted once."""
+    import io
+
+    import pymupdf
+    from PIL import Image
+
+    from synthetic_data_kit.parsers.multimodal_parser import MultimodalParser
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), color="red").save(buffer, format="PNG")
+
+    pdf_path = str(tmp_path / "shared.pdf")
+    doc = pymupdf.open()
+    xref = 0
+    for i in range(3):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {i}")
+        if xref:
+            page.insert_image(pymupdf.Rect(50, 100, 100, 150), xref=xref)
+        else:
+            xref = page.insert_image(pymupdf.Rect(50, 100, 100, 150), stream=buffer.getvalue())
+    doc.save(pdf_path)
+    doc.close()
+
+    with patch.object(pymupdf.Document, "extract_image", autospec=True, side_effect=pymupdf.Document.extract_image) as mock_extract:
+        rows = MultimodalParser().parse(pdf_path)
+
+    assert len(rows) == 3
+    assert all(row["image"] == rows[0]["image"] for row in rows)
+    assert mock_extract.call_count == 1
+
+
+@pytest.mark.unit
+def test_multimodal_pdf_unique_images_not_kept(tmp_path):
+    """Test that images used on only one page are not cached while streaming."""
+    import io
+
+    import pymupdf
+    from PIL import Image
+
+    from synthetic_data_kit.parsers.multimodal_parser import _iter_doc_pages
+
+    pdf_path = str(tmp_path / "scans.pdf")
+    doc = pymupdf.open()
+    for color in ("red", "green", "blue"):
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 8), color=color).save(buffer, format="PNG")
+        page = doc.new_page()
+        page.insert_image(pymupdf.Rect(50, 100, 100, 150), stream=buffer.getvalue())
+    doc.save(pdf_path)
+    doc.close()
+
+    with pymupdf.open(pdf_path) as doc:
+        rows = _iter_doc_pages(doc, 0, doc.page_count)
+        images = []
+        for row in rows:
+            images.append(row["image"])
+            assert rows.gi_frame.f_locals["images"] == {}
+
+    assert len(set(images)) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", ["pymupdf", "pdfminer"])
+def test_pdf_parser_url_parses_from_memory(engine):
+    """Test that downloaded PDFs are parsed from memory without a temp file."""
+    import pymupdf
+
+    doc = pymupdf.open()
+    doc.new_page().insert_text((50, 50), "Downloaded page")
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    mock_response = MagicMock()
+    mock_response.content = pdf_bytes
+
+    with patch("synthetic_data_kit.parsers.pdf_parser.requests.get", return_value=mock_response), patch(
+        "tempfile.NamedTemporaryFile"
+    ) as mock_tempfile:
+        content = PDFParser(engine=engine).parse("https://example.com/doc.pdf")
+
+    mock_tempfile.assert_not_called()
+    assert "Downloaded page" in content[0]["text"]
+
+
+@pytest.mark.unit
+def test_pdf_download_fetches_ranges_in_parallel(monkeypatch):
+    """Test that range-capable servers are downloaded in assembled chunks."""
+    from synthetic_data_kit.parsers import pdf_parser
+
+    payload = bytes(range(256)) * 40
+    requested = []
+
+    def fake_get(url, headers=None):
+        start, end = map(int, headers["Range"].split("=")[1].split("-"))
+        end = min(end, len(payload) - 1)
+        requested.append((start, end))
+        response = MagicMock()
+        response.status_code = 206
+        response.content = payload[start:end + 1]
+        response.headers = {"Content-Range": f"bytes {start}-{end}/{len(payload)}"}
+        return response
+
+    monkeypatch.setattr(pdf_parser, "DOWNLOAD_CHUNK_SIZE", 1000)
+    monkeypatch.setattr(pdf_parser.requests, "get", fake_get)
+
+    assert pdf_parser._download("https://example.com/doc.pdf") == payload
+    assert sorted(requested) == [(i, min(i + 999, len(payload) - 1)) for i in range(0, len(payload), 1000)]
+
+
+@pytest.mark.unit
+def test_pdf_download_without_range_support(monkeypatch):
+    """Test that servers ignoring Range headers return the full body."""
+    from synthetic_data_kit.parsers import pdf_parser
+
+    response = MagicMock()
+    response.status_code = 200
+    response.content = b"%PDF-full-body"
+    mock_get = MagicMock(return_value=response)
+    monkeypatch.setattr(pdf_parser.requests, "get", mock_get)
+
+    assert pdf_parser._download("https://example.com/doc.pdf") == b"%PDF-full-body"
+    mock_get.assert_called_once()
+
+
+@pytest.mark.unit
+def test_pdf_download_with_unknown_total_size(monkeypatch):
+    """Test that a range response without a total size falls back to a full GET."""
+    from synthetic_data_kit.parsers import pdf_parser
+
+    payload = bytes(range(256)) * 12  # 3072 bytes
+    monkeypatch.setattr(pdf_parser, "DOWNLOAD_CHUNK_SIZE", 1000)
+
+    def fake_get(url, headers=None):
+        response = MagicMock()
+        if headers and "Range" in headers:
+            response.status_code = 206
+            response.content = payload[:1000]
+            response.headers = {"Content-Range": "bytes 0-999/*"}
+        else:
+            response.status_code = 200
+            response.content = payload
+            response.headers = {}
+        return response
+
+    monkeypatch.setattr(pdf_parser.requests, "get", fake_get)
+
+    assert pdf_parser._download("https://example.com/doc.pdf") == payload
+
+
+@pytest.mark.unit
+def test_html_parser_lxml_features(tmp_path):
+    """Test that the lxml backend extracts the same text as html.parser."""
+    pytest.importorskip("lxml")
+
+    html_path = tmp_path / "sample.html"
+    html_path.write_text(SAMPLE_HTML, encoding="utf-8")
+
+    default_text = HTMLParser().parse(str(html_path))
+    lxml_text = HTMLParser(features="lxml").parse(str(html_path))
+
+    assert lxml_text == default_text
+    assert "Test Heading" in lxml_text
@@ -34,6 +34,15 @@ def test_split_into_chunks():
     assert empty_chunks == []
 
 
+@pytest.mark.unit
+def test_split_into_chunks_overlap_keeps_last_three_sentences():
+    """Test that a new chunk starts with the last three sentences of the previous one."""
+    first = "One. Two. Three. Four. Five."
+    chunks = text.split_into_chunks(first + "\n\nNext paragraph.", chunk_size=30)
+
+    assert chunks == [first, "Three. Four. Five.\n\nNext paragraph."]
+
+
 @pytest.mark.unit
 def test_extract_json_from_text():
     """Test extracting JSON from text."""
@@ -66,6 +75,25 @@ def test_extract_json_from_text():
         text.extract_json_from_text(invalid_json)
 
 
+@pytest.mark.unit
+def test_extract_json_from_text_stops_at_first_value():
+    """Test extracting JSON followed by prose that contains brackets."""
+    json_text = 'Result: {"question": "Q", "answer": "A"} (see [1] and {notes})'
+
+    assert text.extract_json_from_text(json_text) == {"question": "Q", "answer": "A"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "malformed",
+    ['{"a": 1, "b": [1, 2], }', 'Answer: {"q": "x", "list": [3, 4],, "z": 1}'],
+)
+def test_extract_json_from_text_malformed_outer_value(malformed):
+    """Test that a nested fragment of a malformed value is not returned."""
+    with pytest.raises(ValueError):
+        text.extract_json_from_text(malformed)
+
+
 @pytest.mark.unit
 def test_extract_json_list_from_text():
     """Test extracting JSON list from text."""
@@ -114,6 +142,20 @@ def test_load_config(tmpdir):
     assert loaded_config["test-provider"]["model"] == "test-model"
 
 
+@pytest.mark.unit
+def test_load_config_cached_until_file_changes(tmpdir):
+    """Test that repeated loads are independent copies and see file edits."""
+    config_path = Path(tmpdir) / "test_config.yaml"
+    config_path.write_text("llm:\n  provider: vllm\n")
+
+    first = config.load_config(config_path)
+    first["llm"]["provider"] = "changed"
+    assert config.load_config(config_path)["llm"]["provider"] == "vllm"
+
+    config_path.write_text("llm:\n  provider: api-endpoint\n")
+    assert config.load_config(config_path)["llm"]["provider"] == "api-endpoint"
+
+
 @pytest.mark.unit
 def test_get_llm_provider(mock_config):
     """Test getting the LLM provider from config."""
@@ -1,9 +1,7 @@
 import os
 import tempfile
 import json
-from typing import Dict, List, Tuple, Optional, Any
-from pathlib import Path
-from unittest.mock import patch
+from typing import Dict, List, Tuple, Any
 class TestFileFactory:
     """Factory for creating test files with various content types."""
     